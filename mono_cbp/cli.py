@@ -76,12 +76,12 @@ def main():
         print("\n=== Running Complete Pipeline ===")
         print(f"Catalogue: {args.catalogue}")
         print(f"Data directory: {args.data_dir}")
-        print(f"Output directory: {args.output_dir if hasattr(args, 'output_dir') else './results'}")
-        if hasattr(args, 'plot_dir') and args.plot_dir:
+        print(f"Output directory: {args.output_dir}")
+        if args.plot_dir:
             print(f"Plot directory: {args.plot_dir}")
 
         config = {}
-        if hasattr(args, 'config') and args.config:
+        if args.config:
             print(f"Configuration: {args.config}")
             with open(args.config) as f:
                 config = json.load(f)
@@ -89,9 +89,9 @@ def main():
         pipeline = MonoCBPPipeline(
             catalogue_path=args.catalogue,
             data_dir=args.data_dir,
-            output_dir=args.output_dir if hasattr(args, 'output_dir') else './results',
-            sector_times_path=args.sector_times if hasattr(args, 'sector_times') else None,
-            TEBC=args.tebc if hasattr(args, 'tebc') else False,
+            output_dir=args.output_dir,
+            sector_times_path=args.sector_times,
+            TEBC=args.tebc,
             config=config
         )
 
@@ -99,7 +99,7 @@ def main():
 
         # Prepare kwargs for pipeline steps
         pipeline_kwargs = {}
-        if hasattr(args, 'plot_dir') and args.plot_dir:
+        if args.plot_dir:
             pipeline_kwargs['find_transits_kwargs'] = {'plot_output_dir': args.plot_dir}
 
         results = pipeline.run(**pipeline_kwargs)
@@ -111,7 +111,7 @@ def main():
         n_candidates = 0
         if 'vetting' in results and results['vetting'] is not None:
             vetting_df = results['vetting']
-            n_candidates = len(vetting_df[vetting_df['best_fit'].isin(['T', 'AT'])]) if len(vetting_df) > 0 else 0
+            n_candidates = int(vetting_df['best_fit'].isin(['T', 'AT']).sum()) if len(vetting_df) > 0 else 0
 
         print(f"\nPipeline complete!")
         print(f"  Transit events detected: {n_events}")
@@ -130,12 +130,12 @@ def main():
 
         # Load config from file if provided (for potential future use)
         config = {}
-        if hasattr(args, 'config') and args.config:
+        if args.config:
             print(f"Configuration: {args.config}")
             with open(args.config) as f:
                 config = json.load(f)
 
-        catalogue = load_catalogue(args.catalogue, TEBC=args.tebc if hasattr(args, 'tebc') else False)
+        catalogue = load_catalogue(args.catalogue, TEBC=args.tebc)
         masker = EclipseMasker(catalogue, data_dir=args.data_dir)
 
         print("Starting eclipse masking...\n")
@@ -151,7 +151,7 @@ def main():
         print(f"Catalogue: {args.catalogue}")
         print(f"Data directory: {args.data_dir}")
         print(f"Output file: {args.output}")
-        if hasattr(args, 'plot_dir') and args.plot_dir:
+        if args.plot_dir:
             print(f"Plot directory: {args.plot_dir}")
         if args.threshold:
             print(f"MAD threshold: {args.threshold}")
@@ -160,7 +160,7 @@ def main():
 
         # Load config from file if provided
         config = {}
-        if hasattr(args, 'config') and args.config:
+        if args.config:
             print(f"Configuration: {args.config}")
             with open(args.config) as f:
                 config = json.load(f)
@@ -175,10 +175,10 @@ def main():
                 config['transit_finding'] = {}
             config['transit_finding']['detrending_method'] = args.method
 
-        catalogue = load_catalogue(args.catalogue, TEBC=args.tebc if hasattr(args, 'tebc') else False)
+        catalogue = load_catalogue(args.catalogue, TEBC=args.tebc)
         finder = TransitFinder(
             catalogue=catalogue,
-            sector_times=args.sector_times if hasattr(args, 'sector_times') else None,
+            sector_times=args.sector_times,
             config=config
         )
 
@@ -186,7 +186,7 @@ def main():
         results = finder.process_directory(
             args.data_dir,
             output_file=args.output,
-            plot_output_dir=args.plot_dir if hasattr(args, 'plot_dir') and args.plot_dir else None
+            plot_output_dir=args.plot_dir
         )
         print(f"\nTransit finding complete! Found {len(results)} events")
 
@@ -197,14 +197,14 @@ def main():
         print("\n=== Comparing Models for Vetting ===")
         print(f"Event directory: {args.event_dir}")
         print(f"Output file: {args.output}")
-        if hasattr(args, 'output_dir') and args.output_dir:
+        if args.output_dir:
             print(f"Output directory: {args.output_dir}")
         else:
             print(f"Output directory: {args.event_dir} (default)")
 
         # Load config from file if provided
         config = {}
-        if hasattr(args, 'config') and args.config:
+        if args.config:
             print(f"Configuration: {args.config}")
             with open(args.config) as f:
                 config = json.load(f)
@@ -215,7 +215,7 @@ def main():
         results = comparator.compare_events(
             args.event_dir,
             output_file=args.output,
-            output_dir=args.output_dir if hasattr(args, 'output_dir') and args.output_dir else None
+            output_dir=args.output_dir
         )
         print(f"\nModel comparison complete! Processed {len(results)} events")
 
@@ -225,7 +225,7 @@ def main():
 
         # Load config from file if provided
         config = {}
-        if hasattr(args, 'config') and args.config:
+        if args.config:
             print(f"Configuration: {args.config}")
             with open(args.config) as f:
                 config = json.load(f)
@@ -241,7 +241,7 @@ def main():
         print(f"Data directory: {args.data_dir}")
         print(f"Number of injections per model: {n_injections_display}{' (from config)' if args.n_injections is None else ''}")
         print(f"Output file: {args.output}")
-        if hasattr(args, 'output_dir') and args.output_dir:
+        if args.output_dir:
             print(f"Output directory: {args.output_dir}")
         else:
             print(f"Output directory: {args.data_dir} (default)")
@@ -251,7 +251,7 @@ def main():
             transit_models_path=args.models,
             catalogue=args.catalogue,
             config=config if config else None,
-            TEBC=args.tebc if hasattr(args, 'tebc') else False
+            TEBC=args.tebc
         )
 
         print("\nStarting injection-retrieval...\n")
@@ -259,7 +259,7 @@ def main():
             args.data_dir,
             n_injections=args.n_injections,
             output_file=args.output,
-            output_dir=args.output_dir if hasattr(args, 'output_dir') and args.output_dir else None
+            output_dir=args.output_dir
         )
         print(f"\nInjection-retrieval complete! Processed {len(results)} injections")
 
@@ -12,6 +12,9 @@ DEFAULT_CONFIG = {
         'generate_event_snippets': True,
         'save_event_snippets': True,
         'cadence_minutes': 30,
+        'n_workers': None,
+        'prefetch_depth': 4,
+        'writer_workers': 4,
         'cosine': {
             'win_len_max': 12,
             'win_len_min': 1,
@@ -42,6 +45,7 @@ DEFAULT_CONFIG = {
         'rmse_threshold': 1.2,
         'save_plots': False,
         'plot_dir': None,
+        'n_workers': None,
     },
     'injection_retrieval': {
         'n_injections': 1000,
@@ -3,8 +3,9 @@
 import numpy as np
 import os
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import matplotlib.pyplot as plt
-from ..utils.eclipses import get_eclipse_mask, time_to_phase
+from ..utils.eclipses import get_eclipse_mask_multi, phase_and_eclipse_mask, time_to_phase
 from ..utils.data import get_row, process_tebc_catalogue
 from ..utils import load_catalogue
 
@@ -119,29 +120,6 @@ class EclipseMasker:
 
         return time, flux, flux_err, phase, eclipse_mask_existing
 
-    def _combine_eclipse_masks(self, prim_ecl_mask, sec_ecl_mask, phase):
-        """Combine primary and secondary eclipse masks.
-
-        Args:
-            prim_ecl_mask (np.ndarray): Primary eclipse mask
-            sec_ecl_mask (np.ndarray): Secondary eclipse mask
-            phase (np.ndarray): Binary phase values (used to initialise empty mask if needed)
-
-        Returns:
-            np.ndarray: Combined eclipse mask
-        """
-
-        if np.any(prim_ecl_mask) and np.any(sec_ecl_mask):
-            result = np.logical_or(prim_ecl_mask, sec_ecl_mask)
-        elif np.any(prim_ecl_mask):
-            result = prim_ecl_mask
-        elif np.any(sec_ecl_mask):
-            result = sec_ecl_mask
-        else:
-            result = np.zeros_like(phase, dtype=bool)
-
-        return result
-
     def _parse_filename(self, filename):
         """Parse TIC ID and sector number from filename.
 
@@ -221,7 +199,7 @@ class EclipseMasker:
 
         return data
 
-    def mask_all(self, force=False):
+    def mask_all(self, force=False, n_workers=None):
         """Mask eclipses in all .txt and .npz files in the data directory.
 
         Skips files that cannot be processed (e.g., missing TIC ID in catalogue, unsupported format).
@@ -229,15 +207,29 @@ class EclipseMasker:
         Args:
             force (bool, optional): If True, recalculate phase and mask even if they already exist,
                 using the catalogue ephemeris (period, bjd0). Defaults to False.
+            n_workers (int, optional): Number of worker processes to mask files in parallel.
+                Each file is independent, so masking scales with core count. If None or 1,
+                files are processed serially. Defaults to None.
         """
         files = [f for f in os.listdir(self.data_dir) if f.endswith('.txt') or f.endswith('.npz')]
         logger.info(f"Processing {len(files)} files in {self.data_dir}")
 
-        for file in files:
-            try:
-                self.mask_file(file, force=force)
-            except (FileNotFoundError, ValueError) as e:
-                logger.warning(f"Skipping {file}: {e}")
+        if n_workers is not None and n_workers > 1:
+            logger.info(f"Masking files with {n_workers} workers")
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = {executor.submit(self.mask_file, file, force=force): file
+                           for file in files}
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except (FileNotFoundError, ValueError) as e:
+                        logger.warning(f"Skipping {futures[future]}: {e}")
+        else:
+            for file in files:
+                try:
+                    self.mask_file(file, force=force)
+                except (FileNotFoundError, ValueError) as e:
+                    logger.warning(f"Skipping {file}: {e}")
 
     def mask_file(self, file, force=False):
         """Mask eclipses in a single light curve file (.txt or .npz).
@@ -278,21 +270,26 @@ class EclipseMasker:
         if row is None:
             raise ValueError(f"TIC {tic_id} not found in catalogue.")
 
-        # Calculate phase from ephemeris if not provided in input file, or if force=True
-        if phase is None or force:
-            phase = time_to_phase(time, row['period'], row['bjd0'])
-
         # Check if mask already exists
         if eclipse_mask_existing is not None and not force:
             logger.info(f"Eclipse mask already exists for {file}")
             return
 
-        # Create eclipse masks
-        prim_ecl_mask = get_eclipse_mask(phase, row['prim_pos'], row['prim_width'])
-        sec_ecl_mask = get_eclipse_mask(phase, row['sec_pos'], row['sec_width'])
-
-        # Combine masks
-        eclipse_mask = self._combine_eclipse_masks(prim_ecl_mask, sec_ecl_mask, phase)
+        # Calculate phase from ephemeris if not provided in input file, or if force=True,
+        # fusing the phase fold with both eclipse window tests in a single pass
+        if phase is None or force:
+            phase, eclipse_mask = phase_and_eclipse_mask(
+                time, row['period'], row['bjd0'],
+                row['prim_pos'], row['prim_width'],
+                row['sec_pos'], row['sec_width']
+            )
+        else:
+            # Create the combined eclipse mask from the phase provided in the input file,
+            # resolving both eclipse windows against a single sorted phase array
+            eclipse_mask = get_eclipse_mask_multi(
+                phase,
+                ((row['prim_pos'], row['prim_width']), (row['sec_pos'], row['sec_width']))
+            )
 
         # Save based on format
         if file_ext == '.npz':
@@ -352,18 +349,26 @@ class EclipseMasker:
             else:
                 time, flux, flux_err, phase, eclipse_mask = self._load_txt(file_path)
 
-            # Calculate phase from ephemeris if not provided
-            if phase is None:
-                phase = time_to_phase(time, row['period'], row['bjd0'])
-
-            # Calculate eclipse mask if not provided
-            if eclipse_mask is None:
-                prim_ecl_mask = get_eclipse_mask(phase, row['prim_pos'], row['prim_width'])
-                sec_ecl_mask = get_eclipse_mask(phase, row['sec_pos'], row['sec_width'])
-                eclipse_mask = self._combine_eclipse_masks(prim_ecl_mask, sec_ecl_mask, phase)
+            # Calculate phase and eclipse mask from ephemeris if not provided
+            if phase is None and eclipse_mask is None:
+                phase, eclipse_mask = phase_and_eclipse_mask(
+                    time, row['period'], row['bjd0'],
+                    row['prim_pos'], row['prim_width'],
+                    row['sec_pos'], row['sec_width']
+                )
             else:
-                # Ensure eclipse_mask is 1D boolean array
-                eclipse_mask = np.asarray(eclipse_mask).ravel().astype(bool)
+                if phase is None:
+                    phase = time_to_phase(time, row['period'], row['bjd0'])
+
+                # Calculate eclipse mask if not provided
+                if eclipse_mask is None:
+                    eclipse_mask = get_eclipse_mask_multi(
+                        phase,
+                        ((row['prim_pos'], row['prim_width']), (row['sec_pos'], row['sec_width']))
+                    )
+                else:
+                    # Ensure eclipse_mask is 1D boolean array
+                    eclipse_mask = np.asarray(eclipse_mask).ravel().astype(bool)
 
             # Create array in same format: TIME FLUX FLUX_ERR PHASE ECL_MASK
             data = np.column_stack((time, flux, flux_err, phase, eclipse_mask))
@@ -11,6 +11,7 @@ import scipy.stats as stats
 import warnings
 import pandas as pd
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from ..config import get_default_config, merge_config
 
 logger = logging.getLogger('mono_cbp.model_comparison')
@@ -257,20 +258,9 @@ class ModelComparator:
                     # output_file is just a filename, default to data_dir
                     output_dir = data_dir
 
-            files = [f for f in os.listdir(data_dir) if f.endswith('.npz')]
-            logger.info(f"Processing {len(files)} files from {data_dir}")
-
-            all_results = []
-            for i, file in enumerate(files):
-                if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(files)}")
-
-                file_path = os.path.join(data_dir, file)
-                try:
-                    results = self.compare_event(file_path, save_plot=save_plots, plot_dir=plot_dir)
-                    all_results.append(results)
-                except Exception as e:
-                    logger.error(f"Failed to process {file}: {e}")
+            event_inputs = [os.path.join(data_dir, f) for f in os.listdir(data_dir)
+                            if f.endswith('.npz')]
+            logger.info(f"Processing {len(event_inputs)} files from {data_dir}")
 
         elif isinstance(events_input, list):
             # Process list of in-memory event dictionaries
@@ -285,22 +275,47 @@ class ModelComparator:
                 else:
                     output_dir = '.'  # Current directory as default
 
-            all_results = []
-            for i, event_data in enumerate(events_input):
+            event_inputs = events_input
+
+        else:
+            raise TypeError("events_input must be either a directory path (str) or list of event dictionaries")
+
+        all_results = []
+        n_workers = self.model_config.get('n_workers')
+        if n_workers is not None and n_workers > 1:
+            # Each event is independent, so the model fits can be dispatched to a
+            # process pool. Results arrive in completion order; note that each fit
+            # already samples its chains on 'cores' processes, so the effective
+            # parallelism is n_workers * cores.
+            logger.info(f"Comparing events with {n_workers} workers")
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                futures = {
+                    executor.submit(self.compare_event, event_input,
+                                    save_plot=save_plots, plot_dir=plot_dir): self._event_label(event_input, i)
+                    for i, event_input in enumerate(event_inputs)
+                }
+                for future in as_completed(futures):
+                    try:
+                        all_results.append(future.result())
+                    except Exception as e:
+                        logger.error(f"Failed to process {futures[future]}: {e}")
+        else:
+            for i, event_input in enumerate(event_inputs):
                 if i % 10 == 0:
-                    logger.info(f"Progress: {i}/{len(events_input)}")
+                    logger.info(f"Progress: {i}/{len(event_inputs)}")
 
                 try:
-                    results = self.compare_event(event_data, save_plot=save_plots, plot_dir=plot_dir)
+                    results = self.compare_event(event_input, save_plot=save_plots, plot_dir=plot_dir)
                     all_results.append(results)
                 except Exception as e:
-                    logger.error(f"Failed to process event {i}: {e}")
-
-        else:
-            raise TypeError("events_input must be either a directory path (str) or list of event dictionaries")
+                    logger.error(f"Failed to process {self._event_label(event_input, i)}: {e}")
 
         # Save results
         df = pd.DataFrame(all_results)
+        if len(df) > 0:
+            # Store classifications as a categorical so downstream filters (e.g. isin)
+            # compare integer codes instead of Python strings
+            df['best_fit'] = df['best_fit'].astype('category')
         if output_dir:
             # Ensure output directory exists
             os.makedirs(output_dir, exist_ok=True)
@@ -315,6 +330,21 @@ class ModelComparator:
 
         return df
 
+    @staticmethod
+    def _event_label(event_input, index):
+        """Build a short label for an event input, for log messages.
+
+        Args:
+            event_input (str or dict): Event file path or event data dictionary
+            index (int): Position of the event in the input list
+
+        Returns:
+            str: Filename for file inputs, 'event <index>' for in-memory inputs
+        """
+        if isinstance(event_input, str):
+            return os.path.basename(event_input)
+        return f"event {index}"
+
     def _fit_transit_model(self, time, flux, flux_err, event_time, event_width, event_depth):
         """Fit transit model to data."""
         with Model():
@@ -5,15 +5,12 @@ CBP detection pipeline.
 """
 
 import logging
-from ..eclipse_masking import EclipseMasker
-from ..transit_finding import TransitFinder
-from ..model_comparison import ModelComparator
-from ..injection_retrieval import TransitInjector
+import os
 from ..utils import load_catalogue
 from ..config import get_default_config, merge_config
-import os
-import matplotlib.pyplot as plt
-import numpy as np
+
+# NOTE: Pipeline components (and their matplotlib/pymc import trees) are imported
+# lazily inside the methods that use them to keep CLI startup fast.
 
 logger = logging.getLogger('mono_cbp.pipeline')
 
@@ -54,18 +51,22 @@ class MonoCBPPipeline:
             transit_models_path (str, optional): Path to transit models for injection-retrieval. If None, injection-retrieval is disabled. Defaults to None.
             config (dict, optional): Configuration dictionary. Uses defaults if None.
         """
+        from ..eclipse_masking import EclipseMasker
+        from ..transit_finding import TransitFinder
+        from ..model_comparison import ModelComparator
+
         self.data_dir = data_dir
         self.output_dir = output_dir
         self.config = merge_config(config, get_default_config()) if config else get_default_config()
 
         # Create output directory if it doesn't exist
-        import os
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
             logger.info(f"Created output directory: {output_dir}")
 
-        # Load catalogue
-        self.catalogue = load_catalogue(catalogue_path, TEBC=TEBC)
+        # Load catalogue, indexed by TIC ID so per-target lookups in the components
+        # are hash lookups rather than linear scans
+        self.catalogue = load_catalogue(catalogue_path, TEBC=TEBC).set_index('tess_id', drop=False)
         logger.info(f"Initialised pipeline with {len(self.catalogue)} targets")
 
         # Initialise components
@@ -81,6 +82,8 @@ class MonoCBPPipeline:
 
         # Injection-retrieval (optional)
         if transit_models_path:
+            from ..injection_retrieval import TransitInjector
+
             self.transit_injector = TransitInjector(
                 transit_models_path=transit_models_path,
                 catalogue=self.catalogue,
@@ -163,13 +166,15 @@ class MonoCBPPipeline:
         logger.info("Eclipse masking complete")
 
     def find_transits(self, output_file='transit_events.txt', output_dir=None,
-                     plot_output_dir=None):
+                     plot_output_dir=None, n_workers=None):
         """Run transit finding on all files in data directory.
 
         Args:
             output_file (str, optional): Output filename. Defaults to 'transit_events.txt'.
             output_dir (str, optional): Output directory. Defaults to pipeline's output_dir.
             plot_output_dir (str, optional): Plot output directory. Defaults to None.
+            n_workers (int, optional): Number of worker processes for parallel processing.
+                Defaults to the 'n_workers' config value.
 
         Returns:
             pd.DataFrame: Detected transit events
@@ -181,7 +186,8 @@ class MonoCBPPipeline:
             self.data_dir,
             output_file=output_file,
             output_dir=output_dir,
-            plot_output_dir=plot_output_dir
+            plot_output_dir=plot_output_dir,
+            n_workers=n_workers
         )
         logger.info(f"Transit finding complete: {len(results)} events detected")
         return results
@@ -319,13 +325,18 @@ class MonoCBPPipeline:
             ValueError: If no events found for the given TIC ID and/or event number
             RuntimeError: If transit finding has not been run yet
         """
+        import matplotlib.pyplot as plt
+        import numpy as np
+        from matplotlib.collections import LineCollection
+
         # Check if transit finding has been run
         if not hasattr(self.transit_finder, 'results') or len(self.transit_finder.results.get('tics', [])) == 0:
             raise RuntimeError("No transit events found. Run pipeline.find_transits() or pipeline.run() first.")
 
-        # Get all events for this TIC
+        # Get all events for this TIC with a single vectorized comparison
         tic_str = str(tic_id)
-        event_indices = [i for i, tic in enumerate(self.transit_finder.results['tics']) if tic == tic_str]
+        tics = np.asarray(self.transit_finder.results['tics'])
+        event_indices = np.flatnonzero(tics == tic_str).tolist()
 
         if len(event_indices) == 0:
             raise ValueError(f"No events found for TIC {tic_id}")
@@ -354,6 +365,16 @@ class MonoCBPPipeline:
                           "Set 'generate_event_snippets': True in config.")
             return
 
+        # Pull the per-event properties into local arrays with one gather each,
+        # instead of indexing the results lists item-by-item inside the loop
+        results = self.transit_finder.results
+        match_indices = np.asarray([idx for idx, _ in matching_snippets])
+        sectors = np.asarray(results['sectors'])[match_indices]
+        depths = np.asarray(results['event_depths'])[match_indices]
+        durations = np.asarray(results['event_durations'])[match_indices]
+        snrs = np.asarray(results['event_snrs'])[match_indices]
+        phases = np.asarray(results['event_phases'])[match_indices]
+
         # Create figure with subplots for each event
         n_events = len(matching_snippets)
         fig, axes = plt.subplots(n_events, 1, figsize=(figsize[0], figsize[1] * n_events),
@@ -369,16 +390,22 @@ class MonoCBPPipeline:
             event_time = snippet['event_time']
             event_width = snippet['event_width']
 
-            # Get event properties from results
-            sector = self.transit_finder.results['sectors'][event_idx]
-            depth = self.transit_finder.results['event_depths'][event_idx]
-            duration = self.transit_finder.results['event_durations'][event_idx]
-            snr = self.transit_finder.results['event_snrs'][event_idx]
-            phase = self.transit_finder.results['event_phases'][event_idx]
-
-            # Plot light curve with error bars (straight lines, no caps)
-            ax.errorbar(time, flux, yerr=flux_err, fmt='o', color='navy',
-                       alpha=0.6, markersize=4, capsize=0)
+            # Get event properties from the prefetched arrays
+            sector = sectors[plot_idx]
+            depth = depths[plot_idx]
+            duration = durations[plot_idx]
+            snr = snrs[plot_idx]
+            phase = phases[plot_idx]
+
+            # Plot light curve with error bars (straight lines, no caps); a single
+            # LineCollection plus scatter builds far fewer artists than per-point
+            # errorbar for TESS-cadence snippets
+            segments = np.stack([
+                np.column_stack([time, flux - flux_err]),
+                np.column_stack([time, flux + flux_err]),
+            ], axis=1)
+            ax.add_collection(LineCollection(segments, colors='navy', alpha=0.6, linewidths=1))
+            ax.scatter(time, flux, s=16, c='navy', alpha=0.6)
 
             # Highlight the event region with vertical dotted lines at start and end
             event_start = event_time - event_width / 2
@@ -387,7 +414,9 @@ class MonoCBPPipeline:
             ax.axvline(event_end, color='red', linestyle=':', alpha=0.7, linewidth=1.5)
 
             # Add caret marker at the bottom to indicate event center
-            y_min = np.min(flux) - 0.3 * (np.max(flux) - np.min(flux))
+            flux_min = np.min(flux)
+            flux_range = np.ptp(flux)
+            y_min = flux_min - 0.3 * flux_range
             ax.plot(event_time, y_min, marker='^', color='red', markersize=10,
                    markeredgecolor='red', markerfacecolor='red', clip_on=False, zorder=10)
 
@@ -407,8 +436,7 @@ class MonoCBPPipeline:
             ax.grid(True, alpha=0.3, linestyle='--')
 
             # Set y-axis limits with some padding
-            flux_range = np.max(flux) - np.min(flux)
-            ax.set_ylim(np.min(flux) - 0.4 * flux_range, np.max(flux) + 0.4 * flux_range)
+            ax.set_ylim(flux_min - 0.4 * flux_range, flux_min + 1.4 * flux_range)
 
         if save_fig:
             if event_number is not None:
@@ -4,11 +4,15 @@ import os
 import numpy as np
 import pandas as pd
 import logging
+import queue
+import threading
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 import matplotlib.pyplot as plt
 from ..utils import (
-    bin_to_long_cadence, get_var_mad, monofind, split_tol,
-    time_to_phase, get_eclipse_mask, get_snr
+    bin_to_long_cadence, get_row, get_var_mad, monofind, split_tol,
+    time_to_phase, phase_and_eclipse_mask, get_snr
 )
 from ..utils.detrending import detrend
 from ..utils.plotting import plot_no_events, plot_event
@@ -27,6 +31,30 @@ EVENT_WINDOW_HALF_WIDTH = 0.5  # days (used for event windows when duration < 1
 EVENT_GROUPING_TOLERANCE = 10  # data points
 SKYE_FIGURE_SIZE = (12, 10)
 
+
+def _process_file_worker(finder, file_path, plot_output_dir=None):
+    """Process a single light curve file in a worker process.
+
+    Module-level so it can be pickled by ProcessPoolExecutor. With chunked map
+    dispatch the same unpickled TransitFinder copy is reused for every file in
+    a chunk, so the accumulated results and stats are swapped out for fresh
+    dictionaries before returning; each call hands back a disjoint dict holding
+    only this file's contribution for the parent to merge.
+
+    Args:
+        finder (TransitFinder): TransitFinder instance (pickled copy)
+        file_path (str): Path to light curve file
+        plot_output_dir (str, optional): Directory to save plots. Defaults to None.
+
+    Returns:
+        tuple: (results, stats) dictionaries accumulated for this file
+    """
+    finder.process_file(file_path, plot_output_dir=plot_output_dir)
+    results, finder.results = finder.results, finder._initialise_results()
+    stats, finder.stats = finder.stats, finder._initialise_stats()
+    return results, stats
+
+
 class TransitFinder:
     """Class for finding additional transit events in eclipsing binary light curves.
 
@@ -152,7 +180,8 @@ class TransitFinder:
         self.results = self._initialise_results()
         self.stats = self._initialise_stats()
 
-    def process_directory(self, data_dir, output_file='output.txt', output_dir=None, plot_output_dir=None):
+    def process_directory(self, data_dir, output_file='output.txt', output_dir=None, plot_output_dir=None,
+                          n_workers=None):
         """Process all light curve files in a directory.
 
         Args:
@@ -160,6 +189,10 @@ class TransitFinder:
             output_file (str, optional): Name of output file. Defaults to 'output.txt'.
             output_dir (str, optional): Directory to save output file. Defaults to current working directory.
             plot_output_dir (str, optional): Directory to save plots. Defaults to None.
+            n_workers (int, optional): Number of worker processes to process files in parallel.
+                Each target is independent, so processing scales with core count. If None,
+                the 'n_workers' config value is used; if that is also None (or 1), files
+                are processed serially. Defaults to None.
 
         Returns:
             pd.DataFrame: DataFrame of detected events. Returns empty DataFrame if no events
@@ -175,13 +208,28 @@ class TransitFinder:
         self.stats['total_files'] = len(files)
         logger.info(f"Found {len(files)} files to process")
 
+        if n_workers is None:
+            n_workers = self.transit_config.get('n_workers')
+
         # Process each file
-        for i, file in enumerate(files):
-            if i % PROGRESS_INTERVAL == 0:
-                logger.info(f"Progress: {i}/{len(files)}")
+        if n_workers is not None and n_workers > 1:
+            logger.info(f"Processing files with {n_workers} workers")
+            file_paths = [os.path.join(data_dir, file) for file in files]
+            worker = partial(_process_file_worker, self, plot_output_dir=plot_output_dir)
+            with ProcessPoolExecutor(max_workers=n_workers) as executor:
+                for worker_results, worker_stats in executor.map(worker, file_paths, chunksize=8):
+                    for key, values in worker_results.items():
+                        self.results[key].extend(values)
+                    self.stats['total_events'] += worker_stats['total_events']
+                    self.stats['cosine_successes'] += worker_stats['cosine_successes']
+        else:
+            file_paths = [os.path.join(data_dir, file) for file in files]
+            prefetch_depth = self.transit_config.get('prefetch_depth', 4)
+            for i, (file_path, data) in enumerate(self._iter_prefetched(file_paths, prefetch_depth)):
+                if i % PROGRESS_INTERVAL == 0:
+                    logger.info(f"Progress: {i}/{len(files)}")
 
-            file_path = os.path.join(data_dir, file)
-            self.process_file(file_path, plot_output_dir=plot_output_dir)
+                self.process_file(file_path, plot_output_dir=plot_output_dir, data=data)
 
         # Calculate Skye metric
         if self.sector_times is not None:
@@ -198,6 +246,73 @@ class TransitFinder:
 
         return results_df
 
+    def _load_file(self, file_path):
+        """Load a light curve file, dispatching on its extension.
+
+        Args:
+            file_path (str): Path to light curve file (.npz or .txt)
+
+        Returns:
+            tuple or None: (time, flux, flux_err, phase, ecl_mask) arrays, or None
+            if the file format is unsupported.
+        """
+        ext = os.path.splitext(file_path)[1]
+        if ext == '.npz':
+            return self._load_npz(file_path)
+        elif ext == '.txt':
+            return self._load_txt(file_path)
+        return None
+
+    def _iter_prefetched(self, file_paths, prefetch_depth):
+        """Yield (file_path, data) pairs with file reads overlapped ahead of compute.
+
+        A producer thread loads up to prefetch_depth light curves ahead of the
+        consumer, hiding disk latency behind detrending and event detection.
+        Loading errors are forwarded to the consumer and re-raised there, matching
+        the behaviour of loading inline.
+
+        Args:
+            file_paths (list): Paths of light curve files to load
+            prefetch_depth (int or None): Number of files to read ahead. If None or
+                <= 0, prefetching is disabled and (file_path, None) pairs are yielded
+                so the consumer loads each file itself.
+
+        Yields:
+            tuple: (file_path, data) where data is the tuple returned by _load_file,
+            or None if prefetching is disabled.
+        """
+        if prefetch_depth is None or prefetch_depth <= 0:
+            for file_path in file_paths:
+                yield file_path, None
+            return
+
+        prefetch_queue = queue.Queue(maxsize=prefetch_depth)
+
+        def _producer():
+            for file_path in file_paths:
+                try:
+                    item = (file_path, self._load_file(file_path), None)
+                except Exception as e:
+                    # Forward the error and stop producing; the consumer re-raises
+                    prefetch_queue.put((file_path, None, e))
+                    return
+                prefetch_queue.put(item)
+            prefetch_queue.put(None)
+
+        producer = threading.Thread(target=_producer, daemon=True)
+        producer.start()
+
+        while True:
+            item = prefetch_queue.get()
+            if item is None:
+                break
+            file_path, data, error = item
+            if error is not None:
+                raise error
+            yield file_path, data
+
+        producer.join()
+
     def _load_npz(self, file_path):
         """Load light curve data from npz file.
 
@@ -243,12 +358,15 @@ class TransitFinder:
         ecl_mask = data[:, 4].astype(bool) if data.shape[1] > 4 else None
         return time, flux, flux_err, phase, ecl_mask
 
-    def process_file(self, file_path, plot_output_dir=None):
+    def process_file(self, file_path, plot_output_dir=None, data=None):
         """Process a single light curve file.
 
         Args:
             file_path (str): Path to light curve file
             plot_output_dir (str, optional): Directory to save plots. Defaults to None.
+            data (tuple, optional): Preloaded (time, flux, flux_err, phase, ecl_mask)
+                arrays from _load_file (e.g. from the prefetcher). If None, the file
+                is loaded here. Defaults to None.
 
         Returns:
             list: List of detected event dictionaries. Each event dictionary contains keys:
@@ -259,14 +377,13 @@ class TransitFinder:
         file = os.path.basename(file_path)
         split_file = os.path.splitext(file)
 
-        # Load file data
-        if split_file[1] == '.npz':
-            time, flux, flux_err, phase, ecl_mask = self._load_npz(file_path)
-        elif split_file[1] == '.txt':
-            time, flux, flux_err, phase, ecl_mask = self._load_txt(file_path)
-        else:
+        # Load file data (unless preloaded by the prefetcher)
+        if data is None:
+            data = self._load_file(file_path)
+        if data is None:
             logger.warning(f"Unsupported file format: {file}")
             return []
+        time, flux, flux_err, phase, ecl_mask = data
 
         # Extract TIC and sector
         tic, sector = self._parse_filename(file)
@@ -281,13 +398,15 @@ class TransitFinder:
         if np.median(np.gradient(time[~np.isnan(flux)])) < self.transit_config['cadence_minutes'] * MINUTES_TO_DAYS:
             time, flux, flux_err = bin_to_long_cadence(time, flux, flux_err)
             if self.catalogue is not None:
-                row = self.catalogue[self.catalogue['tess_id'] == tic]
-                if not row.empty:
-                    phase = time_to_phase(time, row['period'].values[0], row['bjd0'].values[0])
+                row = get_row(self.catalogue, tic)
+                if row is not None:
                     if prim_pos is not None:
-                        eclipse_mask_p = get_eclipse_mask(phase, prim_pos, prim_width)
-                        eclipse_mask_s = get_eclipse_mask(phase, sec_pos, sec_width)
-                        ecl_mask = np.logical_or(eclipse_mask_p, eclipse_mask_s)
+                        phase, ecl_mask = phase_and_eclipse_mask(
+                            time, row['period'], row['bjd0'],
+                            prim_pos, prim_width, sec_pos, sec_width
+                        )
+                    else:
+                        phase = time_to_phase(time, row['period'], row['bjd0'])
 
         # Create mask
         nan_mask = ~np.isnan(flux * time * flux_err)
@@ -637,12 +756,12 @@ class TransitFinder:
         if self.catalogue is None:
             return None, None, None, None
 
-        row = self.catalogue[self.catalogue['tess_id'] == tic]
-        if row.empty:
+        row = get_row(self.catalogue, tic)
+        if row is None:
             return None, None, None, None
 
-        return (row['prim_pos'].values[0], row['prim_width'].values[0],
-                row['sec_pos'].values[0], row['sec_width'].values[0])
+        return (row['prim_pos'], row['prim_width'],
+                row['sec_pos'], row['sec_width'])
 
     def _parse_filename(self, filename):
         """Parse TIC ID and sector number from filename.
@@ -829,10 +948,17 @@ class TransitFinder:
             len(self.results['event_snippets']) > 0):
             snippet_dir = os.path.join(output_dir, 'event_snippets')
             os.makedirs(snippet_dir, exist_ok=True)
-            for snippet in self.results['event_snippets']:
-                snippet_file = f"TIC_{snippet['tic']}_{snippet['sector']}_{snippet['event_no']}.npz"
-                snippet_path = os.path.join(snippet_dir, snippet_file)
-                np.savez(snippet_path, **snippet)
+            # Overlap the independent snippet writes in a small thread pool;
+            # resolving the futures re-raises any write error before returning
+            writer_workers = self.transit_config.get('writer_workers', 4)
+            with ThreadPoolExecutor(max_workers=writer_workers) as writer_pool:
+                futures = []
+                for snippet in self.results['event_snippets']:
+                    snippet_file = f"TIC_{snippet['tic']}_{snippet['sector']}_{snippet['event_no']}.npz"
+                    snippet_path = os.path.join(snippet_dir, snippet_file)
+                    futures.append(writer_pool.submit(np.savez, snippet_path, **snippet))
+                for future in futures:
+                    future.result()
             logger.info(f"Saved {len(self.results['event_snippets'])} event snippets to {snippet_dir}")
         elif (self.transit_config['generate_event_snippets'] and
               not self.transit_config.get('save_event_snippets', True) and
@@ -856,6 +982,7 @@ class TransitFinder:
             columns = ['tic', 'sector', 'time', 'phase', 'depth', 'duration', 'snr']
 
         df = pd.DataFrame(output_data, columns=columns)
+
         return df
 
     @staticmethod
@@ -5,11 +5,16 @@ from .data import (
     get_row,
     bin_to_long_cadence,
     catalogue_to_lc_files,
+    txt_to_npz,
 )
 from .eclipses import (
     time_to_phase,
+    time_to_phase_raw,
     get_eclipse_mask,
     get_eclipse_indices,
+    get_eclipse_mask_multi,
+    phase_and_eclipse_mask,
+    clear_mask_cache,
 )
 from .monofind import (
     monofind,
@@ -37,9 +42,14 @@ __all__ = [
     "get_row",
     "bin_to_long_cadence",
     "catalogue_to_lc_files",
+    "txt_to_npz",
     "time_to_phase",
+    "time_to_phase_raw",
     "get_eclipse_mask",
     "get_eclipse_indices",
+    "get_eclipse_mask_multi",
+    "phase_and_eclipse_mask",
+    "clear_mask_cache",
     "monofind",
     "get_var_mad",
     "split_tol",
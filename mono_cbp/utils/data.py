@@ -1,5 +1,7 @@
 """Collection of utility functions for loading and pre-processing TESS data."""
 
+import functools
+
 import numpy as np
 import pandas as pd
 import os
@@ -145,7 +147,9 @@ def load_catalogue(path, TEBC=False):
             sec_pos_2g, sec_pos_pf, sec_width_2g, sec_width_pf. Default: False.
 
     Returns:
-        pd.DataFrame: Catalogue with required columns.
+        pd.DataFrame: Catalogue with required columns. Repeat calls for an unchanged
+        file return a cached DataFrame shared between callers, so copy it before
+        mutating in place.
 
     Raises:
         TypeError: If path is not a string
@@ -157,6 +161,22 @@ def load_catalogue(path, TEBC=False):
     if not os.path.exists(path):
         raise FileNotFoundError(f"Catalogue file not found at {path}")
 
+    # Key the cache on the file's mtime so edits to the catalogue invalidate it
+    return _load_catalogue_cached(path, os.path.getmtime(path), TEBC)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_catalogue_cached(path, mtime, TEBC):
+    """Parse and validate a catalogue file (cached backend of load_catalogue).
+
+    Args:
+        path (str): Path to the catalogue file (.csv or .txt)
+        mtime (float): Modification time of the file (cache key only)
+        TEBC (bool): If True, use TEBC double Gaussian/polyfit logic
+
+    Returns:
+        pd.DataFrame: Catalogue with required columns
+    """
     if path.endswith('.txt'):
         catalogue = pd.read_fwf(path)
     elif path.endswith('.csv'):
@@ -186,6 +206,62 @@ def load_catalogue(path, TEBC=False):
     return catalogue[required_columns]
 
 
+def txt_to_npz(data_dir, remove_txt=False):
+    """Convert .txt light curve files in a directory to binary .npz format.
+
+    Text light curves are re-parsed with np.loadtxt on every pipeline pass; converting
+    them once to .npz lets EclipseMasker and TransitFinder load raw binary columns
+    instead, which is substantially faster for repeated directory scans. Existing
+    column layout is preserved (time, flux, flux_err, and phase/eclipse_mask if present).
+
+    Args:
+        data_dir (str): Directory containing .txt light curve files
+        remove_txt (bool, optional): If True, delete each .txt file after conversion.
+            Note that the pipeline processes both .txt and .npz files, so leaving the
+            originals in place means each target is processed twice. Defaults to False.
+
+    Returns:
+        int: Number of files converted
+
+    Raises:
+        FileNotFoundError: If data_dir does not exist
+    """
+    if not os.path.exists(data_dir):
+        raise FileNotFoundError(f"Data directory does not exist: {data_dir}")
+
+    converted = 0
+    for file in sorted(os.listdir(data_dir)):
+        if not file.endswith('.txt'):
+            continue
+
+        txt_path = os.path.join(data_dir, file)
+        npz_path = os.path.join(data_dir, os.path.splitext(file)[0] + '.npz')
+        if os.path.exists(npz_path):
+            logger.debug(f"{npz_path} already exists, skipping")
+            continue
+
+        data = np.loadtxt(txt_path, skiprows=1)
+        columns = {
+            'time': data[:, 0],
+            'flux': data[:, 1],
+            'flux_err': data[:, 2],
+        }
+        if data.shape[1] > 3:
+            columns['phase'] = data[:, 3]
+        if data.shape[1] > 4:
+            # Eclipse mask is stored as 0/1 integers in the text format
+            columns['eclipse_mask'] = data[:, 4].astype(bool)
+
+        np.savez(npz_path, **columns)
+        converted += 1
+
+        if remove_txt:
+            os.remove(txt_path)
+
+    logger.info(f"Converted {converted} .txt light curves to .npz in {data_dir}")
+    return converted
+
+
 def get_row(catalogue, tic_id):
     """Get the row in a catalogue DataFrame corresponding to a specific TIC ID.
 
@@ -198,9 +274,18 @@ def get_row(catalogue, tic_id):
     """
     if isinstance(catalogue, pd.Series):
         return catalogue if catalogue['tess_id'] == tic_id else None
-    else:
-        row = catalogue[catalogue['tess_id'] == tic_id]
-        return row.iloc[0] if not row.empty else None
+
+    # O(1) hash lookup when the catalogue has been pre-indexed by tess_id
+    # (first row wins for duplicated TIC IDs, matching the scan below)
+    if catalogue.index.name == 'tess_id':
+        try:
+            row = catalogue.loc[tic_id]
+        except KeyError:
+            return None
+        return row.iloc[0] if isinstance(row, pd.DataFrame) else row
+
+    row = catalogue[catalogue['tess_id'] == tic_id]
+    return row.iloc[0] if not row.empty else None
 
 
 def bin_to_long_cadence(time, flux, flux_err):
@@ -1,9 +1,73 @@
 """Collection of utility functions for converting time to phase and obtaining eclipse masks."""
 
+from collections import OrderedDict
+
 import numpy as np
 
+# Maximum number of (phase, eclipse_mask) results kept by phase_and_eclipse_mask
+MASK_CACHE_MAXSIZE = 4096
+
+# LRU cache mapping (time fingerprint, ephemeris, eclipse params) -> (phase, eclipse_mask)
+_mask_cache = OrderedDict()
+
+
+def _time_fingerprint(time):
+    """Build a cheap hashable fingerprint of a time array.
+
+    Uses the array length and end values rather than hashing the full array;
+    light curve files for different (TIC, sector) pairs differ in at least one
+    of these, so this is sufficient to key cached masks.
 
-def time_to_phase(time, period, t0, centre=0.5):
+    Args:
+        time (array_like): Array of time values
+
+    Returns:
+        tuple: Hashable fingerprint of the array
+    """
+    if len(time) == 0:
+        return (0,)
+    return (len(time), float(time[0]), float(time[-1]))
+
+
+def clear_mask_cache():
+    """Clear the cached (phase, eclipse_mask) results used by phase_and_eclipse_mask."""
+    _mask_cache.clear()
+
+
+def time_to_phase_raw(time, period, t0_shifted, start_phase, out=None):
+    """Converts an array of time values to phase, with the epoch shift precomputed.
+
+    Fast path for callers that fold many arrays with the same ephemeris: the
+    centre-dependent shift t0_shifted = t0 + start_phase * period is a scalar
+    that only needs computing once per target, not once per fold.
+
+    Args:
+        times (array_like): Array of time values
+        period (float): Period of the binary
+        t0_shifted (float): Time of mid-eclipse with the phase-fold shift applied
+        start_phase (float): Start of the phase range (centre - 0.5)
+        out (np.ndarray, optional): Preallocated float output array with the same shape
+            as times, reused for every intermediate step. If None, a new array is
+            allocated. Defaults to None.
+
+    Returns:
+        np.ndarray: Array of phase values
+    """
+    # Chain the ufuncs through a single output buffer instead of allocating
+    # a temporary per operation
+    if out is None:
+        out = np.empty(np.shape(time), dtype=float)
+    np.subtract(time, t0_shifted, out=out)
+    np.divide(out, period, out=out)
+    # x - floor(x) is equivalent to x % 1.0 (a value in [0, 1) for any sign of x)
+    # but skips np.mod's sign handling, which is measurably slower
+    np.subtract(out, np.floor(out), out=out)
+    np.add(out, start_phase, out=out)
+
+    return out
+
+
+def time_to_phase(time, period, t0, centre=0.5, out=None):
     """Converts an array of time values to phase.
 
     Args:
@@ -11,15 +75,16 @@ def time_to_phase(time, period, t0, centre=0.5):
         period (float): Period of the binary
         t0 (float): Time of mid-eclipse
         centre (float, optional): Centre of the phase fold. Defaults to 0.5.
+        out (np.ndarray, optional): Preallocated float output array with the same shape
+            as times, reused for every intermediate step. If None, a new array is
+            allocated. Defaults to None.
 
     Returns:
         np.ndarray: Array of phase values
     """
     start_phase = centre - 0.5
-    t0 += start_phase * period
-    phase = ((time - t0) / period) % 1.0 + start_phase
 
-    return phase
+    return time_to_phase_raw(time, period, t0 + start_phase * period, start_phase, out=out)
 
 
 def get_eclipse_indices(phase, pos, width):
@@ -35,21 +100,110 @@ def get_eclipse_indices(phase, pos, width):
     Returns:
         np.ndarray: The indices of in-eclipse data
     """
-    # Check that the position and width values are not NaN, and width is not zero
-    # Note: pos==0 is valid (eclipse at phase 0)
-    if np.isnan(pos) or np.isnan(width) or width == 0:
-        return np.array([], dtype=int)
+    return np.flatnonzero(get_eclipse_mask(phase, pos, width))
 
-    if pos > 0.95:
-        # For eclipses near phase 1, wrap around by subtracting 1 from the upper bound
-        idx = np.where(np.logical_or(phase >= pos - width/2, phase <= pos + width/2 - 1))
-    elif pos < 0.05:
-        # For eclipses near phase 0, wrap around by adding 1 to the lower bound
-        idx = np.where(np.logical_or(phase >= pos - width/2 + 1, phase <= pos + width/2))
-    else:
-        idx = np.where(np.logical_and(phase >= pos - width/2, phase <= pos + width/2))
 
-    return idx[0]
+def get_eclipse_mask_multi(phase, windows):
+    """Compute a combined eclipse mask for several (pos, width) windows.
+
+    Sorts the phase array once and resolves each window with np.searchsorted,
+    so every additional window costs O(log N) index lookups plus the scatter of
+    its in-eclipse points instead of a full-array comparison. The win over
+    repeated get_eclipse_mask calls grows with the number of windows, so for a
+    handful of windows (the usual primary/secondary pair) the O(N log N) sort
+    is skipped in favour of direct comparisons.
+
+    Args:
+        phase (array_like): Phase values to calculate mask
+        windows (iterable): (pos, width) pairs, one per eclipse window. Entries with
+            NaN values or zero width are skipped, as in get_eclipse_mask.
+
+    Returns:
+        np.ndarray: A boolean mask where True indicates an eclipse in any window
+    """
+    phase = np.asarray(phase)
+    windows = tuple(windows)
+
+    if len(windows) <= 2:
+        mask = np.zeros(phase.shape, dtype=bool)
+        for pos, width in windows:
+            mask |= get_eclipse_mask(phase, pos, width)
+        return mask
+
+    mask = np.zeros(phase.shape, dtype=bool)
+
+    order = np.argsort(phase)
+    phase_sorted = phase[order]
+
+    for pos, width in windows:
+        if np.isnan(pos) or np.isnan(width) or width == 0:
+            continue
+
+        half = 0.5 * width
+        if pos > 0.95:
+            # For eclipses near phase 1, wrap around by subtracting 1 from the upper bound
+            bounds = ((pos - half, np.inf), (-np.inf, pos + half - 1))
+        elif pos < 0.05:
+            # For eclipses near phase 0, wrap around by adding 1 to the lower bound
+            bounds = ((pos - half + 1, np.inf), (-np.inf, pos + half))
+        else:
+            bounds = ((pos - half, pos + half),)
+
+        for lo, hi in bounds:
+            # side='left'/'right' makes both bounds inclusive, matching get_eclipse_mask
+            lo_idx = np.searchsorted(phase_sorted, lo, side='left')
+            hi_idx = np.searchsorted(phase_sorted, hi, side='right')
+            mask[order[lo_idx:hi_idx]] = True
+
+    return mask
+
+
+def phase_and_eclipse_mask(time, period, t0, prim_pos, prim_width, sec_pos, sec_width, centre=0.5):
+    """Convert time to phase and compute the combined eclipse mask in one pass.
+
+    Fuses time_to_phase with the primary and secondary eclipse window tests so the
+    phase array is computed once and traversed once per window, instead of separate
+    calls re-deriving phase per eclipse.
+
+    Args:
+        time (array_like): Array of time values
+        period (float): Period of the binary
+        t0 (float): Time of mid-eclipse
+        prim_pos (float): Primary eclipse position (orbital phase)
+        prim_width (float): Primary eclipse width (orbital phase)
+        sec_pos (float): Secondary eclipse position (orbital phase)
+        sec_width (float): Secondary eclipse width (orbital phase)
+        centre (float, optional): Centre of the phase fold. Defaults to 0.5.
+
+    Returns:
+        tuple: (np.ndarray, np.ndarray)
+            - phase: Array of phase values
+            - eclipse_mask: Boolean mask where True indicates an eclipse (primary or secondary)
+
+        Repeat calls with the same inputs return cached arrays shared between
+        callers, so copy them before mutating in place.
+    """
+    # Check the cache first: repeat visits to the same (TIC, sector) file with the same
+    # ephemeris (e.g. mask_all followed by plot_bin_phase_fold) skip recomputation
+    key = (_time_fingerprint(time), period, t0, prim_pos, prim_width, sec_pos, sec_width, centre)
+    cached = _mask_cache.get(key)
+    if cached is not None:
+        _mask_cache.move_to_end(key)
+        return cached
+
+    # The fold itself runs in float64 to keep precision through the t0 subtraction,
+    # but the resulting phase lives in [start, start+1) where float32's ~1e-7
+    # resolution is far below eclipse widths (~1e-2), so the stored phases and the
+    # window tests run at half the memory traffic
+    phase = time_to_phase(time, period, t0, centre=centre).astype(np.float32)
+    eclipse_mask = get_eclipse_mask(phase, prim_pos, prim_width)
+    eclipse_mask |= get_eclipse_mask(phase, sec_pos, sec_width)
+
+    _mask_cache[key] = (phase, eclipse_mask)
+    if len(_mask_cache) > MASK_CACHE_MAXSIZE:
+        _mask_cache.popitem(last=False)
+
+    return phase, eclipse_mask
 
 
 def get_eclipse_mask(phase, pos, width):
@@ -63,8 +217,17 @@ def get_eclipse_mask(phase, pos, width):
     Returns:
         np.ndarray: A boolean mask where True indicates an eclipse
     """
-    idx = get_eclipse_indices(phase, pos, width)
-    mask = np.zeros_like(phase, dtype=bool)
-    mask[idx] = True
+    # Check that the position and width values are not NaN, and width is not zero
+    # Note: pos==0 is valid (eclipse at phase 0)
+    if np.isnan(pos) or np.isnan(width) or width == 0:
+        return np.zeros_like(phase, dtype=bool)
 
-    return mask
+    half = 0.5 * width
+    if pos > 0.95:
+        # For eclipses near phase 1, wrap around by subtracting 1 from the upper bound
+        return (phase >= pos - half) | (phase <= pos + half - 1)
+    elif pos < 0.05:
+        # For eclipses near phase 0, wrap around by adding 1 to the lower bound
+        return (phase >= pos - half + 1) | (phase <= pos + half)
+
+    return (phase >= pos - half) & (phase <= pos + half)